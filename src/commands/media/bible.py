@@ -1,9 +1,9 @@
 import os
 import re
 import sqlite3
-from typing import List
+from typing import Dict, List, NamedTuple
 import discord
-from discord.app_commands import Choice, errors
+from discord.app_commands import Choice
 from discord.ext import commands
 
 BOOKS = {
@@ -76,12 +76,264 @@ BOOKS = {
 }
 
 
+# Common abbreviations keyed by the OSIS code of the book they refer to. Full
+# names and OSIS codes themselves are always accepted and need not be listed.
+ABBREVIATIONS = {
+    "GEN": ("Ge", "Gn"),
+    "EXO": ("Ex", "Exod"),
+    "LEV": ("Le", "Lv"),
+    "NUM": ("Nu", "Nm", "Nb"),
+    "DEU": ("Dt", "Deut"),
+    "JOS": ("Josh", "Jsh"),
+    "JDG": ("Judg", "Jg", "Jdgs"),
+    "RUT": ("Ru", "Rth"),
+    "1SA": ("1 Sam", "1 Sm", "1 S"),
+    "2SA": ("2 Sam", "2 Sm", "2 S"),
+    "1KI": ("1 Kgs", "1 Kin", "1 K"),
+    "2KI": ("2 Kgs", "2 Kin", "2 K"),
+    "1CH": ("1 Chr", "1 Chron"),
+    "2CH": ("2 Chr", "2 Chron"),
+    "EZR": ("Ez",),
+    "NEH": ("Ne",),
+    "EST": ("Esth", "Es"),
+    "JOB": ("Jb",),
+    "PSA": ("Ps", "Psalm", "Pslm", "Psm", "Pss"),
+    "PRO": ("Prov", "Prv", "Pr"),
+    "ECC": ("Eccl", "Eccles", "Qoh"),
+    "SNG": ("Song", "Song of Songs", "Canticles", "SS", "Sol"),
+    "ISA": ("Is",),
+    "JER": ("Je", "Jr"),
+    "LAM": ("La",),
+    "EZK": ("Ezek", "Eze"),
+    "DAN": ("Da", "Dn"),
+    "HOS": ("Ho",),
+    "JOL": ("Jl",),
+    "AMO": ("Am",),
+    "OBA": ("Obad", "Ob"),
+    "JON": ("Jnh",),
+    "MIC": ("Mc",),
+    "NAM": ("Nah", "Na"),
+    "HAB": ("Hb",),
+    "ZEP": ("Zeph", "Zp"),
+    "HAG": ("Hg",),
+    "ZEC": ("Zech", "Zc"),
+    "MAL": ("Ml",),
+    "MAT": ("Matt", "Mt"),
+    "MRK": ("Mk", "Mr"),
+    "LUK": ("Lk", "Lu"),
+    "JHN": ("Jn", "Jhn"),
+    "ACT": ("Ac",),
+    "ROM": ("Ro", "Rm"),
+    "1CO": ("1 Cor",),
+    "2CO": ("2 Cor",),
+    "GAL": ("Ga",),
+    "EPH": ("Ephes",),
+    "PHP": ("Phil",),
+    "COL": ("Co",),
+    "1TH": ("1 Thess", "1 Thes"),
+    "2TH": ("2 Thess", "2 Thes"),
+    "1TI": ("1 Tim", "1 Tm"),
+    "2TI": ("2 Tim", "2 Tm"),
+    "TIT": ("Ti",),
+    "PHM": ("Philem", "Phlm", "Pm"),
+    "HEB": ("He",),
+    "JAS": ("Jas", "Jm"),
+    "1PE": ("1 Pet", "1 Pt", "1 P"),
+    "2PE": ("2 Pet", "2 Pt", "2 P"),
+    "1JN": ("1 Jn", "1 Jhn", "1 J"),
+    "2JN": ("2 Jn", "2 Jhn", "2 J"),
+    "3JN": ("3 Jn", "3 Jhn", "3 J"),
+    "JUD": ("Jud", "Jd"),
+    "REV": ("Re", "Rv", "Apocalypse"),
+}
+
+# Books with a single chapter, where "Jude 3" conventionally means verse 3.
+SINGLE_CHAPTER_BOOKS = {"OBA", "PHM", "2JN", "3JN", "JUD"}
+
+MAX_REFERENCES = 10
+
+# Discord rejects messages longer than this many characters.
+MAX_MESSAGE_LENGTH = 2000
+MAX_MESSAGES = 5
+
+# Upper bound on verse numbers, used to select through the end of a chapter.
+_LAST_VERSE = 999
+
+_REFERENCE_PATTERN = re.compile(
+    r"^(?:(?P<book>\d?\s*[a-z](?:[a-z .]*[a-z.])?)\s*)?"
+    r"(?P<chapter>[1-9]\d{0,2})(?::(?P<verse>[1-9]\d{0,2}))?"
+    r"(?:\s*[-\u2013]\s*(?P<end>[1-9]\d{0,2})(?::(?P<end_verse>[1-9]\d{0,2}))?)?$",
+    re.IGNORECASE,
+)
+
+_PASSAGE_SELECT = (
+    "SELECT ? AS ref, chapter, start_verse, text FROM verse "
+    "WHERE version_id = ? AND book = ? "
+    "AND (chapter, start_verse) BETWEEN (?, ?) AND (?, ?)"
+)
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[\s.]", "", name).lower()
+
+
+def _build_alias_index() -> Dict[str, str]:
+    index = {}
+
+    for name, code in BOOKS.items():
+        for alias in (name, code, *ABBREVIATIONS.get(code, ())):
+            index.setdefault(_normalize(alias), name)
+
+    return index
+
+
+def _build_prefix_index(aliases: Dict[str, str]) -> Dict[str, List[str]]:
+    index: Dict[str, List[str]] = {}
+    order = {name: position for position, name in enumerate(BOOKS)}
+
+    # Books are visited in canonical order, so every bucket stays ordered too.
+    for alias, name in sorted(aliases.items(), key=lambda item: order[item[1]]):
+        for end in range(len(alias) + 1):
+            bucket = index.setdefault(alias[:end], [])
+
+            if name not in bucket:
+                bucket.append(name)
+
+    return index
+
+
+_ALIASES = _build_alias_index()
+_PREFIXES = _build_prefix_index(_ALIASES)
+_BOOK_CHOICES = {
+    prefix: [Choice(name=name, value=name) for name in names[:25]]
+    for prefix, names in _PREFIXES.items()
+}
+
+
+class Reference(NamedTuple):
+    """
+    A span of verses within a single book. A verse of ``None`` leaves that end
+    of the span open, covering the whole of its chapter.
+    """
+
+    book: str
+    chapter: int
+    verse: int | None
+    end_chapter: int
+    end_verse: int | None
+
+    def __str__(self) -> str:
+        start = f"{self.chapter}" if self.verse is None else f"{self.chapter}:{self.verse}"
+
+        if self.end_chapter == self.chapter and self.end_verse == self.verse:
+            return f"{self.book} {start}"
+
+        if self.end_verse is None:
+            end = f"{self.end_chapter}"
+        elif self.end_chapter == self.chapter and self.verse is not None:
+            end = f"{self.end_verse}"
+        else:
+            end = f"{self.end_chapter}:{self.end_verse}"
+
+        return f"{self.book} {start}-{end}"
+
+
+def resolve_book(name: str) -> str | None:
+    """
+    Resolves a full name, abbreviation, OSIS code or unambiguous prefix to the
+    name of the book as it appears in ``BOOKS``.
+    """
+    key = _normalize(name)
+
+    if key in _ALIASES:
+        return _ALIASES[key]
+
+    candidates = _PREFIXES.get(key, [])
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def parse_references(content: str) -> List[Reference]:
+    """
+    Parses semicolon separated references such as "Jn 3:16-4:2; Rom 8". A
+    reference without a book continues from the book before it.
+
+    Raises ValueError with a user facing message on malformed input.
+    """
+    references = []
+    book = None
+
+    for part in filter(None, (part.strip() for part in content.split(";"))):
+        match = _REFERENCE_PATTERN.match(part)
+
+        if match is None:
+            raise ValueError(f'"{part}" is not a valid reference.')
+
+        if match["book"] is not None:
+            book = resolve_book(match["book"])
+
+            if book is None:
+                raise ValueError(f'"{match["book"].strip()}" is not a known book.')
+        elif book is None:
+            raise ValueError(f'"{part}" does not specify a book.')
+
+        chapter = int(match["chapter"])
+        verse = None if match["verse"] is None else int(match["verse"])
+        end = None if match["end"] is None else int(match["end"])
+        end_verse = None if match["end_verse"] is None else int(match["end_verse"])
+
+        if BOOKS[book] in SINGLE_CHAPTER_BOOKS and verse is None and end_verse is None:
+            verse, end_verse = chapter, chapter if end is None else end
+            chapter = end_chapter = 1
+        elif end is None:
+            end_chapter, end_verse = chapter, verse
+        elif end_verse is None and verse is not None:
+            end_chapter, end_verse = chapter, end
+        else:
+            end_chapter = end
+
+        start = (chapter, 0 if verse is None else verse)
+        stop = (end_chapter, _LAST_VERSE if end_verse is None else end_verse)
+
+        if stop < start:
+            raise ValueError(f'"{part}" ends before it begins.')
+
+        references.append(Reference(book, chapter, verse, end_chapter, end_verse))
+
+    if not references:
+        raise ValueError("No references were given.")
+
+    if len(references) > MAX_REFERENCES:
+        raise ValueError(f"Only up to {MAX_REFERENCES} references may be given at once.")
+
+    return references
+
+
+def _paginate(lines: List[str]) -> List[str]:
+    """
+    Packs lines into as few messages as Discord allows, truncating any line
+    too long to fit and anything beyond MAX_MESSAGES.
+    """
+    pages = [""]
+    limit = MAX_MESSAGE_LENGTH - 1
+
+    for line in lines:
+        if len(line) > limit:
+            line = line[: limit - 1] + "…"
+
+        if pages[-1] and len(pages[-1]) + len(line) + 1 > limit:
+            if len(pages) == MAX_MESSAGES:
+                pages[-1] = pages[-1][: limit - 2] + "\n…"
+                break
+
+            pages.append("")
+
+        pages[-1] += f"\n{line}" if pages[-1] else line
+
+    return pages
+
+
 async def _book_autocomplete(_: discord.Interaction, content: str) -> List[Choice[str]]:
-    return [
-        Choice(name=k, value=k)
-        for k in BOOKS.keys()
-        if k.lower().startswith(content.lower())
-    ][:25]
+    return _BOOK_CHOICES.get(_normalize(content), [])
 
 
 class Bible(commands.Cog):
@@ -89,51 +341,88 @@ class Bible(commands.Cog):
         self.client = client
         self.db = sqlite3.connect(os.getenv("BIBLE_DB"))
 
+    def _fetch(self, references: List[Reference]) -> List[List[str]]:
+        """
+        Looks up every reference in a single query, returning the formatted
+        verses of each reference in the order they were given.
+        """
+        query = " UNION ALL ".join([_PASSAGE_SELECT] * len(references))
+        params = []
+
+        for index, ref in enumerate(references):
+            params.extend(
+                (
+                    index,
+                    "eng-kjv",
+                    BOOKS[ref.book],
+                    ref.chapter,
+                    0 if ref.verse is None else ref.verse,
+                    ref.end_chapter,
+                    _LAST_VERSE if ref.end_verse is None else ref.end_verse,
+                )
+            )
+
+        passages = [[] for _ in references]
+        rows = self.db.execute(query + " ORDER BY ref, chapter, start_verse", params)
+
+        for index, chapter, verse_num, text in rows:
+            ref = references[index]
+            label = verse_num if ref.chapter == ref.end_chapter else f"{chapter}:{verse_num}"
+            passages[index].append(f"[{label}] {text.removeprefix('¶').strip()}")
+
+        return passages
+
+    async def _send_passages(self, interaction: discord.Interaction, content: str):
+        try:
+            references = parse_references(content)
+        except ValueError as err:
+            await interaction.response.send_message(str(err), ephemeral=True)
+            return
+
+        lines = []
+
+        for ref, verses in zip(references, self._fetch(references)):
+            if not verses:
+                lines.append(f"*{ref} could not be found.*")
+                continue
+
+            lines.extend(f"> {verse}" for verse in verses)
+            lines.append(f"*{ref}*")
+
+        first, *rest = _paginate(lines)
+        await interaction.response.send_message(first)
+
+        for page in rest:
+            await interaction.followup.send(page)
+
     @discord.app_commands.command()
     @discord.app_commands.describe(book="The book to look into.")
     @discord.app_commands.describe(
-        verse="The verse(s) to look up. Must be in the format of 1:1 for a single verse or 1:2-3 for multiple."
+        verse="The verse(s) to look up, such as 1:1, 1:2-3, 1:2-2:4 or 1 for a whole chapter."
     )
     @discord.app_commands.autocomplete(book=_book_autocomplete)
     async def verse(self, interaction: discord.Interaction, book: str, verse: str):
         """
         Searches a verse or list of verses from one of the books of the bible.
         """
-        if re.match(r"^\d+:(\d+-\d+|\d+)$", verse) is None:
+        if ";" in verse:
             await interaction.response.send_message(
-                "Verse selection is incorrectly formatted."
+                "Only a single reference may be given. Use /passage for more than one.",
+                ephemeral=True,
             )
             return
 
-        finalized_text = []
-        chapter_split = verse.split(":")
-        verse_split = chapter_split[1].split("-")
-
-        if len(verse_split) == 1:
-            verse_split.append(verse_split[0])
-
-        verses = self.db.execute(
-            f"SELECT text FROM verse WHERE version_id = ? AND BOOK = ? AND chapter = ? AND start_verse >= ? AND start_verse <= ?",
-            (
-                "eng-kjv",
-                BOOKS[book],
-                int(chapter_split[0]),
-                int(verse_split[0]),
-                int(verse_split[1]),
-            ),
-        )
-
-        for verse_num, text in zip(
-            range(int(verse_split[0]), int(verse_split[1]) + 1), verses
-        ):
-            finalized_text.append(f"[{verse_num}] {text[0].removeprefix('¶').strip()}")
+        await self._send_passages(interaction, f"{book} {verse}")
 
-        try:
-            await interaction.response.send_message(
-                "> " + "\n> ".join(finalized_text) + f"\n*{book} {verse}*"
-            )
-        except errors.CommandInvokeError as err:
-            await interaction.response.send_message("There appears to be too much text for me to send at once.")
+    @discord.app_commands.command()
+    @discord.app_commands.describe(
+        reference='One or more references separated by semicolons, such as "Jn 3:16-4:2; Rom 8".'
+    )
+    async def passage(self, interaction: discord.Interaction, reference: str):
+        """
+        Searches one or more passages of the bible, which may span chapters.
+        """
+        await self._send_passages(interaction, reference)
 
 
 async def setup(makishima: commands.Bot):